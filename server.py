@@ -1,33 +1,56 @@
 import asyncio
 import atexit
 import dataclasses
-import json
 import logging
 import os
 import signal
+import stat
+import struct
 import sys
+import threading
 import time
+import zlib
 import traceback
+import zipfile
 
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import List, Optional, ClassVar
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, ClassVar, Tuple
 from asyncio.subprocess import Process, STDOUT
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 from aiohttp import web
 from aiopath import AsyncPath as Path
-from zipstream import AioZipStream
+from zipstream import ZipStream, ZIP_STORED
 
 SERVER_START_SCRIPT = "start_server_bepinex.sh"
 UPDATE_SCRIPT = "update.sh"
 DEFAULT_CONFIG_FILE = "config.json"
 STARTUP_TIMEOUT_SECS = 120
+STARTUP_POLL_MIN_SECS = 0.05
+STARTUP_POLL_MAX_SECS = 1.0
+BACKUP_CHUNK_SIZE = 128 * 1024
+JSON_WRAPPED_PREFIX = b'{"status":'
+JSON_COMPRESS_MIN_SIZE = 512
+LOG_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND
+CRC_READ_SIZE = 1024 * 1024
+ZIP_VERSION = 20
+ZIP_UTF8_FLAG = 0x800
+ZIP_MAX_OFFSET = 0xFFFFFFFF
+ZIP_MAX_ENTRIES = 0xFFFF
+ZIP_LOCAL_HEADER = struct.Struct("<4sHHHHHLLLHH")
+ZIP_CENTRAL_HEADER = struct.Struct("<4sHHHHHHLLLHHHHHLL")
+ZIP_END_RECORD = struct.Struct("<4sHHHHLLH")
+WORLD_FILE_EXTENSIONS = frozenset(("fwl", "db"))
+UDP_SOCKET_TABLES = ("/proc/net/udp", "/proc/net/udp6")
+UDP_STATE_UNCONN = "07"
 VALHEIM_TCP_PORTS = (
     list(range(2456, 2457 + 1))
     + list(range(27015, 27030 + 1))
     + list(range(27036, 27037 + 1))
 )
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "DEBUG").upper())
 
 
 class ServerStatus(Enum):
@@ -38,6 +61,7 @@ class ServerStatus(Enum):
 @dataclass
 class ServerConfig:
     FIELD_PREFIX: ClassVar[str] = "server_"
+    FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
 
     name: str = "Valheim Server"
     password: str = "secret"
@@ -49,8 +73,8 @@ class ServerConfig:
     async def load(cls, filename: str = DEFAULT_CONFIG_FILE) -> "ServerConfig":
         path = Path(filename)
         if await path.exists():
-            with path.open("r") as config_file:
-                return cls(**json.load(config_file))
+            async with path.open("r") as config_file:
+                return cls(**orjson.loads(await config_file.read()))
         else:
             config = cls()
             logging.warning(f"Creating new config: {config}")
@@ -59,7 +83,33 @@ class ServerConfig:
     async def dump(self, filename: str = DEFAULT_CONFIG_FILE) -> None:
         path = Path(filename)
         async with path.open("w") as config_file:
-            await config_file.write(json.dumps(dataclasses.asdict(self)))
+            await config_file.write(orjson.dumps(self.to_dict()).decode())
+
+    def to_dict(self) -> dict:
+        # Shallow equivalent of dataclasses.asdict - all fields are scalars
+        return {name: getattr(self, name) for name in self.FIELD_NAMES}
+
+
+ServerConfig.FIELD_NAMES = tuple(
+    field.name for field in dataclasses.fields(ServerConfig)
+)
+
+
+@dataclass
+class StoredZipEntry:
+    name: bytes
+    path: str
+    size: int
+    mtime: float
+    mode: int
+    crc: int = 0
+    offset: int = 0
+
+
+def raw_response(handler):
+    # Mark a handler whose response should skip the json_responses middleware
+    handler.raw_response = True
+    return handler
 
 
 @dataclass
@@ -74,11 +124,14 @@ class ValheimServer:
         self.status = ServerStatus.STOPPED
         self.config: Optional[ServerConfig] = None
         self.process: Optional[Process] = None
-        self.log_file = open(self.log_file_path, "w")
-        self.update_log_file = open(self.update_log_file_path, "w")
-
-        atexit.register(self.log_file.close)
-        atexit.register(self.update_log_file.close)
+        self._worlds_cache: Optional[Tuple[int, List[str]]] = None
+        # Raw descriptors so child output goes straight to the kernel file
+        # without passing through a Python-level buffer
+        self.log_fd = os.open(self.log_file_path, LOG_FILE_FLAGS, 0o644)
+        self.update_log_fd = os.open(self.update_log_file_path, LOG_FILE_FLAGS, 0o644)
+
+        atexit.register(os.close, self.log_fd)
+        atexit.register(os.close, self.update_log_fd)
         atexit.register(self.stop_server_sync)
 
     async def start(self, request: web.Request) -> web.Response:
@@ -87,49 +140,65 @@ class ValheimServer:
                 raise web.HTTPConflict(text="Server already running")
 
             try:
-                request_body = await request.json()
-            except json.JSONDecodeError:
+                request_body = await request.json(loads=orjson.loads)
+            except orjson.JSONDecodeError:
                 request_body = {}
             server_config = await ServerConfig.load()
-            for field in dataclasses.fields(server_config):
-                if field.name in request_body:
-                    setattr(server_config, field.name, request_body[field.name])
+            for name in ServerConfig.FIELD_NAMES:
+                if name in request_body:
+                    setattr(server_config, name, request_body[name])
 
             await self.configure_server(server_config)
             await self.start_server()
 
             logging.debug(f"Started server with configuration: {self.config}")
 
-            return web.HTTPOk(text="Started server")
+            return json_ok("Started server")
 
     async def configure_server(self, config: ServerConfig) -> None:
         await config.dump()
-        for field in dataclasses.fields(ServerConfig):
-            os.environ[f"{ServerConfig.FIELD_PREFIX}{field.name}"] = str(
-                getattr(config, field.name)
+        for name in ServerConfig.FIELD_NAMES:
+            os.environ[f"{ServerConfig.FIELD_PREFIX}{name}"] = str(
+                getattr(config, name)
             )
         self.config = config
 
     async def start_server(self) -> None:
         logging.info("Starting server")
 
-        self.process = await asyncio.create_subprocess_shell(
-            str(Path(self.server_dir) / Path(SERVER_START_SCRIPT)),
-            stdout=self.log_file,
-            stderr=self.log_file,
+        self.process = await asyncio.create_subprocess_exec(
+            os.path.join(self.server_dir, SERVER_START_SCRIPT),
+            stdout=self.log_fd,
+            stderr=self.log_fd,
         )
 
         server_listening = False
 
-        timeout_time = time.time() + STARTUP_TIMEOUT_SECS
-        while time.time() < timeout_time:
-            if await is_udp_port_open(self.config.port):
-                server_listening = True
-                break
-            await asyncio.sleep(1)
+        # Poll with exponential backoff, bailing out early if the process exits
+        loop = asyncio.get_running_loop()
+        exit_task = asyncio.create_task(self.process.wait())
+        delay = STARTUP_POLL_MIN_SECS
+        timeout_time = loop.time() + STARTUP_TIMEOUT_SECS
+        try:
+            while loop.time() < timeout_time:
+                if await is_udp_port_open(self.config.port):
+                    server_listening = True
+                    break
+                done, _pending = await asyncio.wait({exit_task}, timeout=delay)
+                if exit_task in done:
+                    break
+                delay = min(delay * 2, STARTUP_POLL_MAX_SECS)
+        finally:
+            exit_task.cancel()
 
         if server_listening:
             logging.info(f"Valheim server ready on port {self.config.port}")
+        elif self.process.returncode is not None:
+            returncode = self.process.returncode
+            await self.stop_server()
+            raise RuntimeError(
+                f"Server exited with code {returncode} before starting up"
+            )
         else:
             await self.stop_server()
             raise RuntimeError(
@@ -144,16 +213,19 @@ class ValheimServer:
 
             await self.stop_server()
 
-            return web.HTTPOk(text="Server stopped")
+            return json_ok("Server stopped")
 
     async def stop_server(self) -> None:
         logging.info("Stopping server")
         if self.process is not None:
-            self.process.terminate()
+            if self.process.returncode is None:
+                self.process.terminate()
             await self.process.wait()
             self.process = None
         self.status = ServerStatus.STOPPED
         self.config = None
+        # Shutting down flushes world files to disk
+        self._worlds_cache = None
 
     def stop_server_sync(self) -> None:
         logging.info("Stopping server")
@@ -163,31 +235,51 @@ class ValheimServer:
         self.status = ServerStatus.STOPPED
         self.config = None
 
+    @raw_response
     async def backup(self, request: web.Request) -> web.Response:
         async with self.lock:
             was_running = self.status == ServerStatus.RUNNING
             if was_running:
                 await self.stop_server()
 
-            # Perform backup - stream worlds folder to client as zip
-            response = web.StreamResponse()
-            response.content_type = "application/zip"
-            await response.prepare(request)
-
-            worlds_path = Path(self.worlds_dir)
+            # Perform backup - stream worlds folder to client as zip. World files
+            # are already dense binaries, so store them without compression.
+            loop = asyncio.get_running_loop()
+            files = await loop.run_in_executor(None, walk_files, self.worlds_dir)
 
-            files = []
-            async for file_path in worlds_path.glob("**/*"):
-                files.append(
-                    {
-                        "name": str(file_path.relative_to(worlds_path)),
-                        "file": str(file_path),
-                    }
-                )
+            entries = await loop.run_in_executor(None, stat_zip_entries, files)
+            archive_size = stored_zip_size(entries)
 
-            zip_stream = AioZipStream(files=files)
-            async for chunk in zip_stream.stream():
-                await response.write(chunk)
+            response = web.StreamResponse()
+            response.content_type = "application/zip"
+            if archive_size is not None:
+                # Small enough for a plain zip - send file contents with sendfile.
+                # Checksum everything first so read errors surface before any
+                # headers are sent.
+                crcs = await crc32_files([entry.path for entry in entries])
+                for entry, crc in zip(entries, crcs):
+                    entry.crc = crc
+                response.content_length = archive_size
+                await response.prepare(request)
+                await write_stored_zip(request, response, entries)
+            else:
+                # Needs zip64 - let zipstream-ng build the archive
+                zip_stream = ZipStream(compress_type=ZIP_STORED, sized=True)
+                for entry in entries:
+                    zip_stream.add_path(entry.path, entry.name.decode("utf-8"))
+                response.content_length = len(zip_stream)
+                await response.prepare(request)
+
+                # Coalesce small zip records into larger writes to cut per-call
+                # overhead
+                buffer = bytearray()
+                async for chunk in iterate_in_thread(zip_stream):
+                    buffer += chunk
+                    if len(buffer) >= BACKUP_CHUNK_SIZE:
+                        await response.write(bytes(buffer))
+                        buffer.clear()
+                if buffer:
+                    await response.write(bytes(buffer))
 
             if was_running:
                 await self.start_server()
@@ -200,29 +292,43 @@ class ValheimServer:
             if was_running:
                 await self.stop_server()
 
-            update_process = await asyncio.create_subprocess_shell(
-                str(Path(self.server_dir) / Path(UPDATE_SCRIPT)),
-                stdout=self.update_log_file,
-                stderr=self.update_log_file,
+            update_process = await asyncio.create_subprocess_exec(
+                os.path.join(self.server_dir, UPDATE_SCRIPT),
+                stdout=self.update_log_fd,
+                stderr=self.update_log_fd,
             )
             await update_process.wait()
 
             if was_running:
                 await self.start_server()
 
-            return web.HTTPOk(text="Server updated")
+            return json_ok("Server updated")
 
     async def get_worlds(self) -> List[str]:
-        worlds_path = Path(self.worlds_dir)
-        world_names = set()
-        world_file_extensions = {".fwl", ".db"}
-        async for file_path in worlds_path.glob("**/*"):
-            if file_path.suffix in world_file_extensions:
-                world_names.add(file_path.stem)
-        return sorted(world_names)
+        loop = asyncio.get_running_loop()
+        # Worlds only change when the server saves them, so reuse the last
+        # listing until the worlds directory itself is modified. Only entries
+        # added or removed at the top level are tracked - changes inside
+        # subdirectories don't invalidate the cache until the server stops.
+        try:
+            worlds_stat = await loop.run_in_executor(None, os.stat, self.worlds_dir)
+        except FileNotFoundError:
+            # Valheim only creates the worlds directory on its first save
+            return []
+        if (
+            self._worlds_cache is not None
+            and self._worlds_cache[0] == worlds_stat.st_mtime_ns
+        ):
+            return self._worlds_cache[1]
+
+        world_names = await loop.run_in_executor(
+            None, find_world_names, self.worlds_dir
+        )
+        self._worlds_cache = (worlds_stat.st_mtime_ns, world_names)
+        return self._worlds_cache[1]
 
     async def list_worlds(self, request: web.Request) -> web.Response:
-        return web.json_response(await self.get_worlds())
+        return json_ok(await self.get_worlds())
 
     def run_web(self) -> None:
         app = web.Application(middlewares=[json_responses])
@@ -235,46 +341,335 @@ class ValheimServer:
                 web.get("/worlds", self.list_worlds),
             ]
         )
+        app.on_startup.append(use_io_executor)
+        app.on_cleanup.append(shutdown_io_executor)
         port = os.environ.get("PORT", 8080)
         logging.info(f"Starting web server on port: {port}")
         web.run_app(app, port=port)
 
 
+async def use_io_executor(app: web.Application) -> None:
+    # Share one executor sized to the machine for all disk and socket-table work
+    # (directory walks, CRCs, port probes) instead of the oversized default. The
+    # extra worker keeps short jobs moving while CRCs occupy one per CPU.
+    executor = ThreadPoolExecutor(
+        max_workers=(os.cpu_count() or 1) + 1, thread_name_prefix="valheim-io"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    app["io_executor"] = executor
+
+
+async def shutdown_io_executor(app: web.Application) -> None:
+    app["io_executor"].shutdown(wait=False)
+
+
+def json_ok(result, status: int = 200) -> web.Response:
+    return web.Response(
+        body=orjson.dumps({"status": status, "result": result}),
+        status=status,
+        content_type="application/json",
+    )
+
+
 @web.middleware
 async def json_responses(request: web.Request, handler) -> web.Response:
+    if getattr(handler, "raw_response", False):
+        return await handler(request)
+
     # Convert response body to a JSON payload
     try:
         response = await handler(request)
         if response.content_type not in ("application/json", "text/plain"):
             return response
+        if isinstance(response.body, bytes) and response.body.startswith(
+            JSON_WRAPPED_PREFIX
+        ):
+            # Already wrapped by json_ok, don't decode and re-encode it
+            return compress_json(response)
         response_body = response.body
         if isinstance(response_body, bytes):
             response_body = response_body.decode(response.charset)
         if response.content_type == "application/json":
-            response_body = json.loads(response_body)
-        response.body = json.dumps(
+            response_body = orjson.loads(response_body)
+        response.body = orjson.dumps(
             {"status": response.status, "result": response_body,}
-        ).encode("utf-8")
-        return response
+        )
+        return compress_json(response)
     except web.HTTPException as ex:
-        ex.body = json.dumps(
+        ex.body = orjson.dumps(
             {"status": ex.status_code, "message": ex.body.decode("utf-8"),}
-        ).encode("utf-8")
-        raise ex
+        )
+        raise compress_json(ex)
     except Exception as ex:
+        # Full tracebacks walk every frame and read source from disk, so only
+        # build them when debugging
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            error = traceback.format_exception(*sys.exc_info())
+        else:
+            error = traceback.format_exception_only(type(ex), ex)
         server_error = web.HTTPInternalServerError()
-        server_error.body = json.dumps(
-            {"status": 500, "error": traceback.format_exception(*sys.exc_info())}
-        ).encode("utf-8")
-        raise server_error
+        server_error.body = orjson.dumps({"status": 500, "error": error})
+        raise compress_json(server_error)
+
+
+def compress_json(response: web.Response) -> web.Response:
+    # Only the JSON payloads built above are compressed - backup zips are
+    # streamed as-is. The coding is negotiated from Accept-Encoding.
+    if len(response.body) > JSON_COMPRESS_MIN_SIZE:
+        response.enable_compression()
+    return response
+
+
+def scan_files(root: str) -> Iterator[os.DirEntry]:
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            if directory == root:
+                # Valheim only creates the worlds directory on its first save
+                return
+            raise
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield entry
+
+
+def walk_files(root: str) -> List[Tuple[str, str]]:
+    # Walk the tree in a single blocking call so it can run in one executor job
+    # rather than hopping through the event loop once per directory entry
+    return [
+        (os.path.relpath(entry.path, root), entry.path) for entry in scan_files(root)
+    ]
+
+
+def find_world_names(root: str) -> List[str]:
+    world_names = set()
+    for entry in scan_files(root):
+        stem, _dot, extension = entry.name.rpartition(".")
+        if stem and extension in WORLD_FILE_EXTENSIONS:
+            world_names.add(stem)
+    return sorted(world_names)
+
+
+async def iterate_in_thread(
+    iterable: Iterable[bytes], max_pending: int = 16
+) -> AsyncIterator[bytes]:
+    # Drive a blocking iterator from a dedicated thread, handing chunks back to
+    # the event loop through a bounded queue so a slow client applies
+    # backpressure to the producer. The producer lives as long as the download,
+    # so it gets its own thread rather than tying up the shared executor.
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+    done = object()
+    stopped = threading.Event()
+    producer = loop.create_future()
+
+    def produce() -> None:
+        try:
+            for chunk in iterable:
+                asyncio.run_coroutine_threadsafe(queue.put(chunk), loop).result()
+                if stopped.is_set():
+                    break
+        except BaseException as ex:
+            loop.call_soon_threadsafe(producer.set_exception, ex)
+        else:
+            loop.call_soon_threadsafe(producer.set_result, None)
+        finally:
+            asyncio.run_coroutine_threadsafe(queue.put(done), loop).result()
+
+    threading.Thread(target=produce, name="valheim-zip", daemon=True).start()
+    finished = False
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is done:
+                finished = True
+                break
+            yield chunk
+    finally:
+        if not finished:
+            # Consumer went away early - unblock the producer and let it exit
+            stopped.set()
+            while await queue.get() is not done:
+                pass
+        await producer
+
+
+def stat_zip_entries(files: List[Tuple[str, str]]) -> List[StoredZipEntry]:
+    entries = []
+    for name, file_path in files:
+        file_stat = os.lstat(file_path)
+        if not stat.S_ISREG(file_stat.st_mode):
+            # Skip symlinks, sockets etc - only regular files are archived
+            continue
+        entries.append(
+            StoredZipEntry(
+                name=name.encode("utf-8"),
+                path=file_path,
+                size=file_stat.st_size,
+                mtime=file_stat.st_mtime,
+                mode=file_stat.st_mode,
+            )
+        )
+    return entries
+
+
+def stored_zip_size(entries: List[StoredZipEntry]) -> Optional[int]:
+    # Total size of an uncompressed zip of the entries, or None if it would
+    # need zip64 extensions. The maximum field values themselves are reserved
+    # as markers for zip64 records, so they can't be used either.
+    if len(entries) >= ZIP_MAX_ENTRIES:
+        return None
+    offset = 0
+    central_size = 0
+    for entry in entries:
+        if entry.size >= ZIP_MAX_OFFSET or offset >= ZIP_MAX_OFFSET:
+            return None
+        offset += ZIP_LOCAL_HEADER.size + len(entry.name) + entry.size
+        central_size += ZIP_CENTRAL_HEADER.size + len(entry.name)
+    if offset >= ZIP_MAX_OFFSET:
+        return None
+    return offset + central_size + ZIP_END_RECORD.size
+
+
+def crc32_file(path: str) -> int:
+    crc = 0
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(CRC_READ_SIZE)
+            if not chunk:
+                return crc
+            crc = zlib.crc32(chunk, crc)
+
+
+async def crc32_files(paths: List[str]) -> List[int]:
+    # zlib.crc32 releases the GIL on large buffers, so checksum files in
+    # parallel, bounded to one per CPU to avoid thrashing the disk
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+    async def crc32_bounded(path: str) -> int:
+        async with semaphore:
+            return await loop.run_in_executor(None, crc32_file, path)
+
+    return await asyncio.gather(*(crc32_bounded(path) for path in paths))
+
+
+def dos_datetime(timestamp: float) -> Tuple[int, int]:
+    # Zip timestamps are MS-DOS local time, which only covers 1980-2107. Clamp
+    # out of range times the same way zipfile does.
+    year, month, day, hour, minute, second = time.localtime(timestamp)[:6]
+    if year < 1980:
+        year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+    elif year > 2107:
+        year, month, day, hour, minute, second = 2107, 12, 31, 23, 59, 58
+    dos_time = (hour << 11) | (minute << 5) | (second // 2)
+    dos_date = ((year - 1980) << 9) | (month << 5) | day
+    return dos_time, dos_date
+
+
+async def write_stored_zip(
+    request: web.Request, response: web.StreamResponse, entries: List[StoredZipEntry]
+) -> None:
+    # Write an uncompressed zip of entries whose CRCs are already filled in,
+    # sending each file's contents straight from the page cache with sendfile.
+    # asyncio falls back to buffered reads and writes when the transport can't
+    # sendfile (e.g. TLS).
+    loop = asyncio.get_running_loop()
+    offset = 0
+    for entry in entries:
+        entry.offset = offset
+        dos_time, dos_date = dos_datetime(entry.mtime)
+        await response.write(
+            ZIP_LOCAL_HEADER.pack(
+                b"PK\x03\x04",
+                ZIP_VERSION,
+                ZIP_UTF8_FLAG,
+                zipfile.ZIP_STORED,
+                dos_time,
+                dos_date,
+                entry.crc,
+                entry.size,
+                entry.size,
+                len(entry.name),
+                0,
+            )
+            + entry.name
+        )
+        if entry.size:
+            if request.transport is None:
+                raise ConnectionResetError("Connection lost")
+            with open(entry.path, "rb") as file:
+                sent = await loop.sendfile(request.transport, file, 0, entry.size)
+            if sent != entry.size:
+                # The file shrank since it was stat'd - abort rather than send a
+                # corrupt archive that falls short of the Content-Length
+                raise RuntimeError(
+                    f"Sent {sent} of {entry.size} bytes for {entry.path}"
+                )
+        offset += ZIP_LOCAL_HEADER.size + len(entry.name) + entry.size
+
+    central_directory = bytearray()
+    for entry in entries:
+        dos_time, dos_date = dos_datetime(entry.mtime)
+        central_directory += ZIP_CENTRAL_HEADER.pack(
+            b"PK\x01\x02",
+            (3 << 8) | ZIP_VERSION,  # Made by Unix
+            ZIP_VERSION,
+            ZIP_UTF8_FLAG,
+            zipfile.ZIP_STORED,
+            dos_time,
+            dos_date,
+            entry.crc,
+            entry.size,
+            entry.size,
+            len(entry.name),
+            0,
+            0,
+            0,
+            0,
+            (entry.mode & 0xFFFF) << 16,
+            entry.offset,
+        )
+        central_directory += entry.name
+    central_directory += ZIP_END_RECORD.pack(
+        b"PK\x05\x06",
+        0,
+        0,
+        len(entries),
+        len(entries),
+        len(central_directory),
+        offset,
+        0,
+    )
+    await response.write(bytes(central_directory))
+
+
+def udp_port_bound(port: int) -> bool:
+    # Read the kernel's socket tables directly rather than forking `ss`
+    suffix = f":{port:04X}"
+    for table in UDP_SOCKET_TABLES:
+        try:
+            with open(table) as sockets:
+                next(sockets, None)  # Skip header
+                for line in sockets:
+                    _slot, local_address, _remote, state = line.split(None, 4)[:4]
+                    # Like `ss -lu`, only count unconnected (listening) sockets
+                    if state == UDP_STATE_UNCONN and local_address.endswith(suffix):
+                        return True
+        except FileNotFoundError:
+            continue
+    return False
 
 
 async def is_udp_port_open(port: int) -> bool:
-    ss_proc = await asyncio.create_subprocess_shell(
-        "ss -lnu", stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
-    )
-    stdout, _stderr = await ss_proc.communicate()
-    return f":{port} " in stdout.decode()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, udp_port_bound, port)
 
 
 if __name__ == "__main__":